@@ -8,21 +8,206 @@ Creates individual note files for each recipe plus a table of contents.
 
 import os
 import re
+import sys
 import argparse
+import functools
+import multiprocessing
+import operator
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
+from lxml.html import HtmlElement
 import shutil
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterator, Optional, Tuple
 import html
 import unicodedata
 
+# Paprika exports are UTF-8; setting it up front skips encoding detection.
+HTML_PARSER = lxml.html.HTMLParser(encoding='utf-8')
+
+# Compiled once at import; these run many times per recipe.
+_WS_RE = re.compile(r'\s+')
+_LEADING_NUM_RE = re.compile(r'^\d+\.\s*')
+_RECIPE_PREFIX_RE = re.compile(r'^(Recipe:\s*|RECIPE:\s*)', re.IGNORECASE)
+_TITLE_JOIN_SPLIT_RE = re.compile(r'(\s+(?:with|and|&|in|on|for|or)\s+)', re.IGNORECASE)
+_TITLE_JOIN_RE = re.compile(r'\s+(?:with|and|&|in|on|for|or)\s+', re.IGNORECASE)
+# One alternation per time unit, so a single scan handles every form.
+_TIME_RE = re.compile(
+    r'(?P<hours>\d+)\s*h\s*(?P<minutes>\d+)\s*m\b'
+    r'|(?P<min>\d+)(?:\s*mins?\b|\s+minutesutes)'
+    r'|(?P<hr>\d+)(?:\s*hrs?\b|\s+hoursours)',
+    re.IGNORECASE,
+)
+_SERVINGS_PREFIX_RE = re.compile(r'^(Yield:\s*|Serves:\s*)', re.IGNORECASE)
+_ABBREV_RE = re.compile(
+    r'\b(t|tsp|tbsp|c|cups?|lbs?|pounds?|oz|ounces?|pkgs?)\b', re.IGNORECASE
+)
+_ABBREV_MAP = {
+    't': 'tbsp', 'tsp': 'tsp', 'tbsp': 'tbsp',
+    'c': 'cup', 'cup': 'cup', 'cups': 'cup',
+    'lb': 'lb', 'lbs': 'lb', 'pound': 'lb', 'pounds': 'lb',
+    'oz': 'oz', 'ounce': 'oz', 'ounces': 'oz',
+    'pkg': 'package', 'pkgs': 'package',
+}
+_PARAGRAPH_SPLIT_RE = re.compile(r'\n\s*\n|\. {2,}')
+_NUTRITION_SPLIT_RE = re.compile(r'[,;]|\n')
+_UNSAFE_FILENAME_RE = re.compile(r'[<>:"/\\|?*]')
+_AMPERSAND_RE = re.compile(r'[&]')
+
+# Standard names for common categories, checked in order as substrings.
+_CATEGORY_MAPPING = {
+    'air fryer': 'Air Fryer',
+    'crockpot': 'Crockpot',
+    'slow cooker': 'Slow Cooker',
+    'instant pot': 'Instant Pot',
+    'pressure cooker': 'Pressure Cooker',
+    'oven': 'Oven',
+    'stove': 'Stovetop',
+    'grill': 'Grilled',
+    'no bake': 'No Bake',
+    'vegetarian': 'Vegetarian',
+    'vegan': 'Vegan',
+    'keto': 'Keto',
+    'low carb': 'Low Carb',
+    'gluten free': 'Gluten Free',
+    'dairy free': 'Dairy Free'
+}
+
+
+# A sentence starting with one of these (case-insensitive) begins a new step
+_ACTION_PREFIXES = (
+    'heat', 'cook', 'add', 'mix', 'stir', 'combine', 'bake', 'fry', 'grill',
+    'roast', 'simmer', 'boil', 'sauté', 'season', 'serve', 'remove', 'place',
+    'put', 'set', 'preheat', 'prepare', 'cut', 'chop', 'slice', 'dice', 'mince',
+)
+_ACTION_PREFIX_LEN = max(map(len, _ACTION_PREFIXES))
+
+# Static parts of every recipe note; only the title and body vary.
+_RECIPE_HTML_HEAD = '<!DOCTYPE html>\n<html><head><meta charset="UTF-8">'
+_RECIPE_HTML_STYLE = '\n'.join([
+    '<style>',
+    'body { font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", sans-serif; margin: 20px; line-height: 1.6; color: #1d1d1f; }',
+    'h1 { color: #1d1d1f; border-bottom: 3px solid #007aff; padding-bottom: 12px; margin-bottom: 20px; font-size: 28px; }',
+    'h2 { color: #007aff; margin-top: 30px; margin-bottom: 15px; font-size: 20px; font-weight: 600; }',
+    '.metadata { background: linear-gradient(135deg, #f5f5f7 0%, #e8e8ea 100%); padding: 20px; border-radius: 12px; margin: 20px 0; border-left: 4px solid #007aff; }',
+    '.metadata p { margin: 8px 0; }',
+    '.metadata strong { color: #1d1d1f; }',
+    '.ingredients { background: linear-gradient(135deg, #f0f9ff 0%, #e0f2fe 100%); padding: 20px; border-radius: 12px; margin: 20px 0; border-left: 4px solid #0ea5e9; }',
+    '.instructions { margin: 20px 0; }',
+    '.instructions ol { padding-left: 0; counter-reset: step-counter; }',
+    '.instructions li { list-style: none; counter-increment: step-counter; margin-bottom: 15px; padding: 15px; background-color: #fafafa; border-radius: 8px; border-left: 4px solid #10b981; position: relative; }',
+    '.instructions li::before { content: counter(step-counter); position: absolute; left: -25px; top: 15px; background: #10b981; color: white; width: 20px; height: 20px; border-radius: 50%; display: flex; align-items: center; justify-content: center; font-size: 12px; font-weight: bold; }',
+    '.notes { background: linear-gradient(135deg, #fffbf0 0%, #fef3c7 100%); padding: 20px; border-radius: 12px; margin: 20px 0; border-left: 4px solid #f59e0b; }',
+    '.nutrition { background: linear-gradient(135deg, #f0fdf4 0%, #dcfce7 100%); padding: 20px; border-radius: 12px; margin: 20px 0; border-left: 4px solid #22c55e; }',
+    'ul { padding-left: 20px; }',
+    'li { margin-bottom: 8px; }',
+    'a { color: #007aff; text-decoration: none; }',
+    'a:hover { text-decoration: underline; }',
+    '.source { margin: 25px 0; padding: 15px; background-color: #f8f9fa; border-radius: 8px; border-left: 4px solid #6c757d; }',
+    '</style>',
+    '</head><body>',
+])
+_HTML_TAIL = '</body></html>'
+
+
+def _normalize_time_match(match: 're.Match') -> str:
+    """Expand a single _TIME_RE match into its spelled-out form."""
+    if match.group('hours'):
+        return f"{match.group('hours')} hours {match.group('minutes')} minutes"
+    if match.group('min'):
+        return f"{match.group('min')} minutes"
+    return f"{match.group('hr')} hours"
+
+
+def _split_steps(text: str) -> List[str]:
+    """Split cleaned instruction text into steps in a single pass.
+    
+    A step boundary is a space that follows '.', '!' or '?' and precedes a
+    capitalised sentence starting with a cooking action word. Text is
+    expected to have its whitespace collapsed to single spaces already.
+    """
+    steps = []
+    start = 0
+    pos = text.find(' ')
+    while pos != -1:
+        nxt = pos + 1
+        if (text[pos - 1] in '.!?' and 'A' <= text[nxt:nxt + 1] <= 'Z'
+                and text[nxt:nxt + _ACTION_PREFIX_LEN].lower().startswith(_ACTION_PREFIXES)):
+            steps.append(text[start:pos])
+            start = nxt
+        pos = text.find(' ', nxt)
+    steps.append(text[start:])
+    return steps
+
+
+def _clean_text(text: str) -> str:
+    """Clean and normalize text content."""
+    if not text:
+        return ""
+    
+    # Plain ASCII without entities is unchanged by both steps below
+    if text.isascii() and '&' not in text:
+        return _WS_RE.sub(' ', text).strip()
+    
+    # Normalize unicode characters
+    text = unicodedata.normalize('NFKC', text)
+    
+    # Decode HTML entities
+    text = html.unescape(text)
+    
+    # Remove extra whitespace and normalize
+    text = _WS_RE.sub(' ', text).strip()
+    
+    return text
+
+
+@functools.lru_cache(maxsize=4096)
+def _clean_category(category: str) -> str:
+    """Clean and standardize category names."""
+    category = _clean_text(category)
+    
+    # Standardize common category names
+    category_lower = category.lower()
+    for key, value in _CATEGORY_MAPPING.items():
+        if key in category_lower:
+            category = value
+            break
+    else:
+        # Title case if not found in mapping
+        category = category.title()
+    
+    return category
+
+
+@functools.lru_cache(maxsize=4096)
+def _clean_time(time_str: str) -> str:
+    """Clean and standardize time values."""
+    time_str = _clean_text(time_str)
+    
+    if not time_str:
+        return ""
+    
+    # Standardize time formats (also collapses duplicated "minutesutes" /
+    # "hoursours" suffixes) - be careful about word boundaries
+    return _TIME_RE.sub(_normalize_time_match, time_str)
+
+
+@functools.lru_cache(maxsize=4096)
+def _escape_html(text: str) -> str:
+    """Escape HTML special characters."""
+    if not text:
+        return ""
+    return html.escape(text, quote=True)
+
 
 class Recipe:
     """Represents a single recipe with all its components."""
     
-    def __init__(self, html_file: Path):
+    def __init__(self, html_file: Path, html_bytes: bytes):
         self.source_file = html_file
         self.title = ""
+        self.title_lower = ""
         self.categories = []
         self.prep_time = ""
         self.cook_time = ""
@@ -35,264 +220,198 @@ class Recipe:
         self.nutrition = ""
         self.image_path = ""
         
-        self._parse_html()
+        self._parse_html(html_bytes)
     
-    def _parse_html(self):
-        """Parse the Paprika HTML file and extract recipe data."""
+    def _parse_html(self, html_bytes: bytes):
+        """Parse the Paprika HTML content and extract recipe data."""
         try:
-            with open(self.source_file, 'r', encoding='utf-8') as f:
-                soup = BeautifulSoup(f.read(), 'html.parser')
+            if not html_bytes.strip():
+                return
             
-            # Extract title
-            title_elem = soup.find('h1', {'itemprop': 'name'})
-            if title_elem:
-                self.title = self._clean_title(title_elem.get_text().strip())
+            # Reject files that are not valid UTF-8, as reading them in text
+            # mode used to, instead of letting lxml substitute U+FFFD
+            html_bytes.decode('utf-8')
             
-            # Extract categories
-            categories_elem = soup.find('p', {'itemprop': 'recipeCategory'})
-            if categories_elem:
-                categories_text = categories_elem.get_text().strip()
-                self.categories = [self._clean_category(cat.strip()) for cat in categories_text.split(',') if cat.strip()]
+            tree = lxml.html.document_fromstring(html_bytes, parser=HTML_PARSER)
             
-            # Extract timing information
-            prep_elem = soup.find('span', {'itemprop': 'prepTime'})
-            if prep_elem:
-                self.prep_time = self._clean_time(prep_elem.get_text().strip())
-                
-            cook_elem = soup.find('span', {'itemprop': 'cookTime'})
-            if cook_elem:
-                self.cook_time = self._clean_time(cook_elem.get_text().strip())
-                
-            servings_elem = soup.find('span', {'itemprop': 'recipeYield'})
-            if servings_elem:
-                self.servings = self._clean_servings(servings_elem.get_text().strip())
-            
-            # Extract source information
-            source_elem = soup.find('a', {'itemprop': 'url'})
-            if source_elem:
-                self.source_url = source_elem.get('href', '').strip()
-                author_elem = source_elem.find('span', {'itemprop': 'author'})
-                if author_elem:
-                    self.source_name = self._clean_text(author_elem.get_text().strip())
-            
-            # Extract ingredients
-            ingredient_elems = soup.find_all('p', {'itemprop': 'recipeIngredient'})
-            for elem in ingredient_elems:
-                ingredient_text = self._clean_ingredient(elem.get_text().strip())
-                if ingredient_text:
-                    self.ingredients.append(ingredient_text)
-            
-            # Extract instructions
-            instructions_elem = soup.find('div', {'itemprop': 'recipeInstructions'})
-            if instructions_elem:
-                # Get the raw HTML to preserve line breaks
-                instructions_html = str(instructions_elem)
-                self.instructions = self._clean_instructions(instructions_html)
-            
-            # Extract notes
-            notes_elem = soup.find('div', {'itemprop': 'comment'})
-            if notes_elem:
-                notes_html = str(notes_elem)
-                self.notes = self._clean_notes(notes_html)
-            
-            # Extract nutrition
-            nutrition_elem = soup.find('div', {'itemprop': 'nutrition'})
-            if nutrition_elem:
-                nutrition_html = str(nutrition_elem)
-                self.nutrition = self._clean_nutrition(nutrition_html)
-            
-            # Extract image path
-            img_elem = soup.find('img', {'itemprop': 'image'})
-            if img_elem:
-                self.image_path = img_elem.get('src', '')
+            # Walk the itemprop elements once and dispatch on (tag, itemprop).
+            # Only the first match of each field is used, except ingredients.
+            seen = set()
+            for elem in tree.iterfind('.//*[@itemprop]'):
+                key = (elem.tag, elem.get('itemprop'))
+                handler = self._ITEMPROP_HANDLERS.get(key)
+                if handler is None:
+                    continue
+                if key != ('p', 'recipeIngredient'):
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                handler(self, elem)
                 
         except Exception as e:
             print(f"Error parsing {self.source_file}: {e}")
     
-    def _clean_text(self, text: str) -> str:
-        """Clean and normalize text content."""
-        if not text:
-            return ""
-        
-        # Normalize unicode characters
-        text = unicodedata.normalize('NFKC', text)
-        
-        # Decode HTML entities
-        text = html.unescape(text)
-        
-        # Remove extra whitespace and normalize
-        text = re.sub(r'\s+', ' ', text).strip()
-        
-        return text
+    def _extract_title(self, elem: HtmlElement):
+        """Extract the recipe title."""
+        self.title = self._clean_title(elem.text_content().strip())
+        self.title_lower = self.title.lower()
+    
+    def _extract_categories(self, elem: HtmlElement):
+        """Extract the comma-separated categories."""
+        categories_text = elem.text_content().strip()
+        self.categories = [_clean_category(cat.strip()) for cat in categories_text.split(',') if cat.strip()]
+    
+    def _extract_prep_time(self, elem: HtmlElement):
+        """Extract the prep time."""
+        self.prep_time = _clean_time(elem.text_content().strip())
+    
+    def _extract_cook_time(self, elem: HtmlElement):
+        """Extract the cook time."""
+        self.cook_time = _clean_time(elem.text_content().strip())
+    
+    def _extract_servings(self, elem: HtmlElement):
+        """Extract the servings."""
+        self.servings = self._clean_servings(elem.text_content().strip())
+    
+    def _extract_source(self, elem: HtmlElement):
+        """Extract the source URL and author name."""
+        self.source_url = elem.get('href', '').strip()
+        author_elem = elem.find(".//span[@itemprop='author']")
+        if author_elem is not None:
+            self.source_name = _clean_text(author_elem.text_content().strip())
+    
+    def _extract_ingredient(self, elem: HtmlElement):
+        """Extract a single ingredient line."""
+        ingredient_text = self._clean_ingredient(elem.text_content().strip())
+        if ingredient_text:
+            self.ingredients.append(ingredient_text)
+    
+    def _extract_instructions(self, elem: HtmlElement):
+        """Extract the instruction steps."""
+        self.instructions = self._clean_instructions(elem)
+    
+    def _extract_notes(self, elem: HtmlElement):
+        """Extract the recipe notes."""
+        self.notes = self._clean_notes(elem)
+    
+    def _extract_nutrition(self, elem: HtmlElement):
+        """Extract the nutrition information."""
+        self.nutrition = self._clean_nutrition(elem)
+    
+    def _extract_image(self, elem: HtmlElement):
+        """Extract the image path."""
+        self.image_path = elem.get('src', '')
+    
+    # Recipe fields keyed by the (tag, itemprop) pair that holds them
+    _ITEMPROP_HANDLERS = {
+        ('h1', 'name'): _extract_title,
+        ('p', 'recipeCategory'): _extract_categories,
+        ('span', 'prepTime'): _extract_prep_time,
+        ('span', 'cookTime'): _extract_cook_time,
+        ('span', 'recipeYield'): _extract_servings,
+        ('a', 'url'): _extract_source,
+        ('p', 'recipeIngredient'): _extract_ingredient,
+        ('div', 'recipeInstructions'): _extract_instructions,
+        ('div', 'comment'): _extract_notes,
+        ('div', 'nutrition'): _extract_nutrition,
+        ('img', 'image'): _extract_image,
+    }
     
     def _clean_title(self, title: str) -> str:
         """Clean and standardize recipe titles."""
-        title = self._clean_text(title)
+        title = _clean_text(title)
         
         if not title:
             return "Untitled Recipe"
         
         # Remove leading numbers and dots (e.g., "1.", "20.", etc.)
-        title = re.sub(r'^\d+\.\s*', '', title)
+        title = _LEADING_NUM_RE.sub('', title)
         
         # Remove common prefixes that might be inconsistent
-        title = re.sub(r'^(Recipe:\s*|RECIPE:\s*)', '', title, flags=re.IGNORECASE)
+        title = _RECIPE_PREFIX_RE.sub('', title)
         
         # Clean up all-caps titles (convert to title case if more than 70% is uppercase)
-        if len([c for c in title if c.isupper()]) > len(title) * 0.7 and len(title) > 3:
+        if len(title) > 3 and sum(map(str.isupper, title)) > len(title) * 0.7:
             # Split on common separators and title case each part
-            parts = re.split(r'(\s+(?:with|and|&|in|on|for|or)\s+)', title, flags=re.IGNORECASE)
+            parts = _TITLE_JOIN_SPLIT_RE.split(title)
             title_parts = []
             for part in parts:
-                if re.match(r'\s+(?:with|and|&|in|on|for|or)\s+', part, re.IGNORECASE):
+                if _TITLE_JOIN_RE.match(part):
                     title_parts.append(part.lower())
                 else:
                     title_parts.append(part.title())
             title = ''.join(title_parts)
         
         # Fix common title formatting issues
-        title = re.sub(r'\s+', ' ', title)  # Multiple spaces
+        title = _WS_RE.sub(' ', title)  # Multiple spaces
         title = title.strip()
         
         return title
     
-    def _clean_category(self, category: str) -> str:
-        """Clean and standardize category names."""
-        category = self._clean_text(category)
-        
-        # Standardize common category names
-        category_mapping = {
-            'air fryer': 'Air Fryer',
-            'crockpot': 'Crockpot',
-            'slow cooker': 'Slow Cooker',
-            'instant pot': 'Instant Pot',
-            'pressure cooker': 'Pressure Cooker',
-            'oven': 'Oven',
-            'stove': 'Stovetop',
-            'grill': 'Grilled',
-            'no bake': 'No Bake',
-            'vegetarian': 'Vegetarian',
-            'vegan': 'Vegan',
-            'keto': 'Keto',
-            'low carb': 'Low Carb',
-            'gluten free': 'Gluten Free',
-            'dairy free': 'Dairy Free'
-        }
-        
-        category_lower = category.lower()
-        for key, value in category_mapping.items():
-            if key in category_lower:
-                category = value
-                break
-        else:
-            # Title case if not found in mapping
-            category = category.title()
-        
-        return category
-    
-    def _clean_time(self, time_str: str) -> str:
-        """Clean and standardize time values."""
-        time_str = self._clean_text(time_str)
-        
-        if not time_str:
-            return ""
-        
-        # Standardize time formats - be more careful about word boundaries
-        time_str = re.sub(r'(\d+)\s*mins?\b', r'\1 minutes', time_str, flags=re.IGNORECASE)
-        time_str = re.sub(r'(\d+)\s*hrs?\b', r'\1 hours', time_str, flags=re.IGNORECASE)
-        time_str = re.sub(r'(\d+)\s*h\s*(\d+)\s*m\b', r'\1 hours \2 minutes', time_str, flags=re.IGNORECASE)
-        
-        # Handle cases where "minutes" might already be there to avoid duplication
-        time_str = re.sub(r'(\d+)\s+minutesutes', r'\1 minutes', time_str, flags=re.IGNORECASE)
-        time_str = re.sub(r'(\d+)\s+hoursours', r'\1 hours', time_str, flags=re.IGNORECASE)
-        
-        return time_str
-    
     def _clean_servings(self, servings: str) -> str:
         """Clean and standardize serving information."""
-        servings = self._clean_text(servings)
+        servings = _clean_text(servings)
         
         # Remove "Yield:" prefix if present
-        servings = re.sub(r'^(Yield:\s*|Serves:\s*)', '', servings, flags=re.IGNORECASE)
+        servings = _SERVINGS_PREFIX_RE.sub('', servings)
         
         return servings
     
     def _clean_ingredient(self, ingredient: str) -> str:
         """Clean and standardize ingredient formatting."""
-        ingredient = self._clean_text(ingredient)
+        ingredient = _clean_text(ingredient)
         
         if not ingredient:
             return ""
         
-        # Standardize fractions
-        fraction_map = {
-            '½': '1/2', '⅓': '1/3', '⅔': '2/3', '¼': '1/4', '¾': '3/4',
-            '⅕': '1/5', '⅖': '2/5', '⅗': '3/5', '⅘': '4/5', '⅙': '1/6',
-            '⅚': '5/6', '⅛': '1/8', '⅜': '3/8', '⅝': '5/8', '⅞': '7/8'
-        }
-        
-        for unicode_frac, ascii_frac in fraction_map.items():
-            ingredient = ingredient.replace(unicode_frac, ascii_frac)
+        # Unicode fractions need no mapping here: the NFKC step in _clean_text
+        # has already decomposed them (e.g. '½' -> '1⁄2')
         
         # Standardize common abbreviations
-        abbrev_map = {
-            r'\bT\b': 'tbsp', r'\btsp\b': 'tsp', r'\btbsp\b': 'tbsp',
-            r'\bc\b': 'cup', r'\bC\b': 'cup', r'\bcups?\b': 'cup',
-            r'\blb\b': 'lb', r'\blbs\b': 'lb', r'\bpounds?\b': 'lb',
-            r'\boz\b': 'oz', r'\bounces?\b': 'oz',
-            r'\bpkg\b': 'package', r'\bpkgs\b': 'package'
-        }
-        
-        for pattern, replacement in abbrev_map.items():
-            ingredient = re.sub(pattern, replacement, ingredient, flags=re.IGNORECASE)
+        # casefold() maps the characters IGNORECASE also accepts, such as the
+        # long s or the Kelvin sign, onto the ASCII keys
+        ingredient = _ABBREV_RE.sub(
+            lambda m: _ABBREV_MAP.get(m.group(1).casefold(), m.group(0)), ingredient
+        )
         
         return ingredient
     
-    def _clean_instructions(self, instructions_html: str) -> List[str]:
+    def _split_on_br(self, elem: HtmlElement) -> List[str]:
+        """Return the text of an element split at each <br> tag."""
+        runs = [[]]
+        events = ('start', 'end', 'comment', 'pi')
+        for event, node in etree.iterwalk(elem, events=events):
+            if event == 'start':
+                if node.tag == 'br':
+                    runs.append([])
+                if node.text:
+                    runs[-1].append(node.text)
+            # Comments and processing instructions only contribute their tail
+            elif node is not elem and node.tail:
+                runs[-1].append(node.tail)
+        return [''.join(run) for run in runs]
+    
+    def _clean_instructions(self, elem: HtmlElement) -> List[str]:
         """Clean and format instructions into proper steps."""
-        if not instructions_html:
+        if elem is None:
             return []
         
-        # Parse HTML to extract text while preserving structure
-        soup = BeautifulSoup(instructions_html, 'html.parser')
-        text = soup.get_text()
-        text = self._clean_text(text)
+        # Extract text from the already-parsed element
+        text = elem.text_content()
+        text = _clean_text(text)
         
         # Split into steps - try multiple delimiters
         steps = []
         
         # First try splitting on <br/> if present in original
-        if '<br/>' in instructions_html.lower():
-            raw_steps = re.split(r'<br\s*/?>', instructions_html, flags=re.IGNORECASE)
-            for step in raw_steps:
-                step_soup = BeautifulSoup(step, 'html.parser')
-                step_text = self._clean_text(step_soup.get_text())
+        if elem.find('.//br') is not None:
+            for step in self._split_on_br(elem):
+                step_text = _clean_text(step)
                 if step_text:
                     steps.append(step_text)
         else:
             # Try splitting on sentence endings followed by capital letters
-            sentences = re.split(r'(?<=[.!?])\s+(?=[A-Z])', text)
-            current_step = ""
-            
-            for sentence in sentences:
-                sentence = sentence.strip()
-                if not sentence:
-                    continue
-                
-                # If sentence starts with cooking action words, it's likely a new step
-                action_words = r'^(heat|cook|add|mix|stir|combine|bake|fry|grill|roast|simmer|boil|sauté|season|serve|remove|place|put|set|preheat|prepare|cut|chop|slice|dice|mince)'
-                
-                if re.match(action_words, sentence, re.IGNORECASE) and current_step:
-                    steps.append(current_step.strip())
-                    current_step = sentence
-                else:
-                    if current_step:
-                        current_step += " " + sentence
-                    else:
-                        current_step = sentence
-            
-            if current_step:
-                steps.append(current_step.strip())
+            steps = _split_steps(text)
         
         # Clean up each step
         cleaned_steps = []
@@ -302,7 +421,7 @@ class Recipe:
                 continue
             
             # Remove step numbers if present
-            step = re.sub(r'^\d+\.\s*', '', step)
+            step = _LEADING_NUM_RE.sub('', step)
             
             # Ensure step ends with proper punctuation
             if step and not step[-1] in '.!?':
@@ -312,55 +431,51 @@ class Recipe:
         
         return cleaned_steps
     
-    def _clean_notes(self, notes_html: str) -> List[str]:
+    def _clean_notes(self, elem: HtmlElement) -> List[str]:
         """Clean and format notes into paragraphs."""
-        if not notes_html:
+        if elem is None:
             return []
         
-        soup = BeautifulSoup(notes_html, 'html.parser')
-        
         # Handle paragraph tags
-        paragraphs = soup.find_all('p')
+        paragraphs = list(elem.iterdescendants('p'))
         if paragraphs:
             notes = []
             for p in paragraphs:
-                note_text = self._clean_text(p.get_text())
+                note_text = _clean_text(p.text_content())
                 if note_text:
                     notes.append(note_text)
             return notes
         else:
             # Fallback to splitting by line breaks
-            text = soup.get_text()
-            text = self._clean_text(text)
+            text = elem.text_content()
+            text = _clean_text(text)
             if text:
                 # Split on double line breaks or other paragraph indicators
-                notes = re.split(r'\n\s*\n|\. {2,}', text)
-                return [self._clean_text(note) for note in notes if self._clean_text(note)]
+                notes = _PARAGRAPH_SPLIT_RE.split(text)
+                return [_clean_text(note) for note in notes if _clean_text(note)]
             return []
     
-    def _clean_nutrition(self, nutrition_html: str) -> List[str]:
+    def _clean_nutrition(self, elem: HtmlElement) -> List[str]:
         """Clean and format nutrition information."""
-        if not nutrition_html:
+        if elem is None:
             return []
         
-        soup = BeautifulSoup(nutrition_html, 'html.parser')
-        text = soup.get_text()
-        text = self._clean_text(text)
+        text = elem.text_content()
+        text = _clean_text(text)
         
         if not text:
             return []
         
         # Split nutrition info by line breaks or common delimiters
-        nutrition_items = re.split(r'<br\s*/?>', nutrition_html, flags=re.IGNORECASE)
-        if len(nutrition_items) == 1:
+        if elem.find('.//br') is not None:
+            nutrition_items = self._split_on_br(elem)
+        else:
             # Try other delimiters
-            nutrition_items = re.split(r'[,;]|\n', text)
+            nutrition_items = _NUTRITION_SPLIT_RE.split(text)
         
         cleaned_items = []
         for item in nutrition_items:
-            soup_item = BeautifulSoup(item, 'html.parser') if '<' in item else None
-            item_text = soup_item.get_text() if soup_item else item
-            item_text = self._clean_text(item_text)
+            item_text = _clean_text(item)
             
             if item_text and ':' in item_text:
                 # Format nutrition items consistently
@@ -374,49 +489,27 @@ class Recipe:
     
     def to_clean_html(self) -> str:
         """Convert recipe to clean HTML format suitable for Apple Notes."""
-        html_parts = []
-        
-        # Start HTML document
-        html_parts.append('<!DOCTYPE html>')
-        html_parts.append('<html><head><meta charset="UTF-8">')
-        html_parts.append('<title>' + self._escape_html(self.title) + '</title>')
-        html_parts.append('<style>')
-        html_parts.append('body { font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", sans-serif; margin: 20px; line-height: 1.6; color: #1d1d1f; }')
-        html_parts.append('h1 { color: #1d1d1f; border-bottom: 3px solid #007aff; padding-bottom: 12px; margin-bottom: 20px; font-size: 28px; }')
-        html_parts.append('h2 { color: #007aff; margin-top: 30px; margin-bottom: 15px; font-size: 20px; font-weight: 600; }')
-        html_parts.append('.metadata { background: linear-gradient(135deg, #f5f5f7 0%, #e8e8ea 100%); padding: 20px; border-radius: 12px; margin: 20px 0; border-left: 4px solid #007aff; }')
-        html_parts.append('.metadata p { margin: 8px 0; }')
-        html_parts.append('.metadata strong { color: #1d1d1f; }')
-        html_parts.append('.ingredients { background: linear-gradient(135deg, #f0f9ff 0%, #e0f2fe 100%); padding: 20px; border-radius: 12px; margin: 20px 0; border-left: 4px solid #0ea5e9; }')
-        html_parts.append('.instructions { margin: 20px 0; }')
-        html_parts.append('.instructions ol { padding-left: 0; counter-reset: step-counter; }')
-        html_parts.append('.instructions li { list-style: none; counter-increment: step-counter; margin-bottom: 15px; padding: 15px; background-color: #fafafa; border-radius: 8px; border-left: 4px solid #10b981; position: relative; }')
-        html_parts.append('.instructions li::before { content: counter(step-counter); position: absolute; left: -25px; top: 15px; background: #10b981; color: white; width: 20px; height: 20px; border-radius: 50%; display: flex; align-items: center; justify-content: center; font-size: 12px; font-weight: bold; }')
-        html_parts.append('.notes { background: linear-gradient(135deg, #fffbf0 0%, #fef3c7 100%); padding: 20px; border-radius: 12px; margin: 20px 0; border-left: 4px solid #f59e0b; }')
-        html_parts.append('.nutrition { background: linear-gradient(135deg, #f0fdf4 0%, #dcfce7 100%); padding: 20px; border-radius: 12px; margin: 20px 0; border-left: 4px solid #22c55e; }')
-        html_parts.append('ul { padding-left: 20px; }')
-        html_parts.append('li { margin-bottom: 8px; }')
-        html_parts.append('a { color: #007aff; text-decoration: none; }')
-        html_parts.append('a:hover { text-decoration: underline; }')
-        html_parts.append('.source { margin: 25px 0; padding: 15px; background-color: #f8f9fa; border-radius: 8px; border-left: 4px solid #6c757d; }')
-        html_parts.append('</style>')
-        html_parts.append('</head><body>')
+        html_parts = [
+            _RECIPE_HTML_HEAD,
+            f'<title>{_escape_html(self.title)}</title>',
+            _RECIPE_HTML_STYLE,
+        ]
         
         # Title
-        html_parts.append(f'<h1>{self._escape_html(self.title)}</h1>')
+        html_parts.append(f'<h1>{_escape_html(self.title)}</h1>')
         
         # Metadata section
         if any([self.prep_time, self.cook_time, self.servings, self.categories]):
             html_parts.append('<div class="metadata">')
             metadata_items = []
             if self.prep_time:
-                metadata_items.append(f'<p><strong>Prep Time:</strong> {self._escape_html(self.prep_time)}</p>')
+                metadata_items.append(f'<p><strong>Prep Time:</strong> {_escape_html(self.prep_time)}</p>')
             if self.cook_time:
-                metadata_items.append(f'<p><strong>Cook Time:</strong> {self._escape_html(self.cook_time)}</p>')
+                metadata_items.append(f'<p><strong>Cook Time:</strong> {_escape_html(self.cook_time)}</p>')
             if self.servings:
-                metadata_items.append(f'<p><strong>Servings:</strong> {self._escape_html(self.servings)}</p>')
+                metadata_items.append(f'<p><strong>Servings:</strong> {_escape_html(self.servings)}</p>')
             if self.categories:
-                categories_str = ", ".join(self._escape_html(cat) for cat in self.categories)
+                categories_str = ", ".join(_escape_html(cat) for cat in self.categories)
                 metadata_items.append(f'<p><strong>Categories:</strong> {categories_str}</p>')
             
             html_parts.extend(metadata_items)
@@ -428,7 +521,7 @@ class Recipe:
             html_parts.append('<h2>Ingredients</h2>')
             html_parts.append('<ul>')
             for ingredient in self.ingredients:
-                html_parts.append(f'<li>{self._escape_html(ingredient)}</li>')
+                html_parts.append(f'<li>{_escape_html(ingredient)}</li>')
             html_parts.append('</ul>')
             html_parts.append('</div>')
         
@@ -438,7 +531,7 @@ class Recipe:
             html_parts.append('<div class="instructions">')
             html_parts.append('<ol>')
             for step in self.instructions:
-                html_parts.append(f'<li>{self._escape_html(step)}</li>')
+                html_parts.append(f'<li>{_escape_html(step)}</li>')
             html_parts.append('</ol>')
             html_parts.append('</div>')
         
@@ -447,7 +540,7 @@ class Recipe:
             html_parts.append('<div class="notes">')
             html_parts.append('<h2>Notes</h2>')
             for note in self.notes:
-                html_parts.append(f'<p>{self._escape_html(note)}</p>')
+                html_parts.append(f'<p>{_escape_html(note)}</p>')
             html_parts.append('</div>')
         
         # Source
@@ -456,9 +549,9 @@ class Recipe:
             html_parts.append('<h2>Source</h2>')
             if self.source_url:
                 source_text = self.source_name or self.source_url
-                html_parts.append(f'<p><a href="{self._escape_html(self.source_url)}" target="_blank">{self._escape_html(source_text)}</a></p>')
+                html_parts.append(f'<p><a href="{_escape_html(self.source_url)}" target="_blank">{_escape_html(source_text)}</a></p>')
             else:
-                html_parts.append(f'<p>{self._escape_html(self.source_name)}</p>')
+                html_parts.append(f'<p>{_escape_html(self.source_name)}</p>')
             html_parts.append('</div>')
         
         # Nutrition
@@ -466,23 +559,66 @@ class Recipe:
             html_parts.append('<div class="nutrition">')
             html_parts.append('<h2>Nutrition Information</h2>')
             for nutrition_item in self.nutrition:
-                html_parts.append(f'<p>{self._escape_html(nutrition_item)}</p>')
+                html_parts.append(f'<p>{_escape_html(nutrition_item)}</p>')
             html_parts.append('</div>')
         
         # End HTML document
-        html_parts.append('</body></html>')
+        html_parts.append(_HTML_TAIL)
         
         return '\n'.join(html_parts)
+
+
+def _iter_recipe_files(directory: Path) -> Iterator[Path]:
+    """Recursively yield recipe HTML files, skipping index.html.
     
-    def _escape_html(self, text: str) -> str:
-        """Escape HTML special characters."""
-        if not text:
-            return ""
-        return (text.replace('&', '&amp;')
-                   .replace('<', '&lt;')
-                   .replace('>', '&gt;')
-                   .replace('"', '&quot;')
-                   .replace("'", '&#x27;'))
+    Uses os.scandir so only matching entries become Path objects. Files in a
+    directory come before its subdirectories, the same order as rglob.
+    """
+    try:
+        entries = os.scandir(directory)
+    except OSError:
+        # Directories that cannot be listed (unreadable, missing, or not a
+        # directory at all) yield nothing, as with Path.rglob
+        return
+    
+    subdirs = []
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.name.endswith('.html') and entry.name.lower() != 'index.html':
+                yield Path(entry.path)
+    
+    for subdir in subdirs:
+        yield from _iter_recipe_files(subdir)
+
+
+def _read_file(html_file: Path) -> Optional[bytes]:
+    """Read a recipe file, returning None if it cannot be read."""
+    try:
+        return html_file.read_bytes()
+    except OSError as e:
+        print(f"Error reading {html_file.name}: {e}")
+        return None
+
+
+def _process_file(html_file: Path, html_bytes: Optional[bytes]) -> Optional[Tuple[Recipe, bytes]]:
+    """Parse a recipe file's contents and render its clean HTML as UTF-8.
+    
+    Runs in a worker process. Returns None if the file could not be used.
+    """
+    if html_bytes is None:
+        return None
+    
+    try:
+        recipe = Recipe(html_file, html_bytes)
+        if not recipe.title:  # Only keep if we successfully parsed a title
+            print(f"Warning: Could not parse title from {html_file.name}")
+            return None
+        return recipe, recipe.to_clean_html().encode('utf-8')
+    except Exception as e:
+        print(f"Error processing {html_file.name}: {e}")
+        return None
 
 
 class PaprikaToAppleNotesConverter:
@@ -500,11 +636,11 @@ class PaprikaToAppleNotesConverter:
         # Create output directory
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
-        # Find and parse all recipe HTML files
-        self._find_recipes()
+        # Find all recipe HTML files
+        recipe_files = self._find_recipes()
         
-        # Convert each recipe
-        self._convert_recipes()
+        # Parse and convert each recipe
+        self._convert_recipes(recipe_files)
         
         # Create table of contents
         self._create_table_of_contents()
@@ -518,55 +654,80 @@ class PaprikaToAppleNotesConverter:
         print(f"4. Select the folder: {self.output_dir}")
         print(f"5. Check 'Preserve folder structure on import' if desired")
     
-    def _find_recipes(self):
+    def _find_recipes(self) -> List[Path]:
         """Find all recipe HTML files in the source directory."""
         print("Finding recipe files...")
         
-        html_files = list(self.source_dir.rglob("*.html"))
-        
-        # Filter out index.html and other non-recipe files
-        recipe_files = [f for f in html_files if f.name.lower() != 'index.html']
+        recipe_files = list(_iter_recipe_files(self.source_dir))
         
         print(f"Found {len(recipe_files)} recipe files")
         
-        for html_file in recipe_files:
-            try:
-                recipe = Recipe(html_file)
-                if recipe.title:  # Only add if we successfully parsed a title
-                    self.recipes.append(recipe)
-                else:
-                    print(f"Warning: Could not parse title from {html_file.name}")
-            except Exception as e:
-                print(f"Error processing {html_file.name}: {e}")
-        
-        print(f"Successfully parsed {len(self.recipes)} recipes")
+        return recipe_files
     
-    def _convert_recipes(self):
-        """Convert all recipes to clean HTML format."""
+    def _convert_recipes(self, recipe_files: List[Path]):
+        """Parse and convert all recipes to clean HTML format."""
         print("Converting recipes to Apple Notes format...")
         
-        for i, recipe in enumerate(self.recipes, 1):
-            try:
+        # File reads and writes run on threads so disk latency overlaps with
+        # parsing. Parsing and rendering are CPU-bound, so fan them out
+        # across processes; results come back in order. Workers are spawned
+        # rather than forked, since forking while the I/O threads run can
+        # hand a child a lock that one of them holds.
+        mp_context = multiprocessing.get_context('spawn')
+        with ThreadPoolExecutor(max_workers=32) as io_pool, \
+                ProcessPoolExecutor(mp_context=mp_context) as executor:
+            contents = io_pool.map(_read_file, recipe_files)
+            results = executor.map(_process_file, recipe_files, contents, chunksize=16)
+            
+            # Pending writes keyed by lower-cased filename, so recipes whose
+            # titles collide (even on case-insensitive file systems) are
+            # written in order and the last one wins, as with serial writes
+            writes: Dict[str, Tuple[str, Future]] = {}
+            
+            for processed, result in enumerate(results, 1):
+                if processed % 50 == 0:  # Progress update every 50 files
+                    print(f"Processed {processed}/{len(recipe_files)} files...")
+                
+                if result is None:
+                    continue
+                
+                recipe, clean_html = result
+                
+                # Unpickling creates fresh strings for every recipe; intern the
+                # often-repeated ones so the table of contents shares them
+                recipe.categories = [sys.intern(category) for category in recipe.categories]
+                recipe.source_name = sys.intern(recipe.source_name)
+                self.recipes.append(recipe)
+                
                 # Create safe filename
                 safe_filename = self._make_safe_filename(recipe.title)
                 output_file = self.output_dir / f"{safe_filename}.html"
                 
-                # Write clean HTML
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    f.write(recipe.to_clean_html())
+                key = safe_filename.lower()
+                if key in writes:
+                    self._finish_write(*writes.pop(key))
                 
-                if i % 50 == 0:  # Progress update every 50 recipes
-                    print(f"Converted {i}/{len(self.recipes)} recipes...")
-                    
-            except Exception as e:
-                print(f"Error converting {recipe.title}: {e}")
+                # Write clean HTML, already encoded by the worker
+                writes[key] = (recipe.title, io_pool.submit(output_file.write_bytes, clean_html))
+            
+            for title, future in writes.values():
+                self._finish_write(title, future)
+        
+        print(f"Successfully parsed {len(self.recipes)} recipes")
+    
+    def _finish_write(self, title: str, future: Future):
+        """Wait for a queued recipe write and report any failure."""
+        try:
+            future.result()
+        except Exception as e:
+            print(f"Error converting {title}: {e}")
     
     def _create_table_of_contents(self):
         """Create a table of contents HTML file."""
         print("Creating table of contents...")
         
         # Sort recipes by title
-        sorted_recipes = sorted(self.recipes, key=lambda r: r.title.lower())
+        sorted_recipes = sorted(self.recipes, key=operator.attrgetter('title_lower'))
         
         html_parts = []
         html_parts.append('<!DOCTYPE html>')
@@ -611,7 +772,7 @@ class PaprikaToAppleNotesConverter:
                 html_parts.append(f'<h2>{current_letter}</h2>')
             
             html_parts.append('<div class="recipe-item">')
-            html_parts.append(f'<div class="recipe-title">{recipe._escape_html(recipe.title)}</div>')
+            html_parts.append(f'<div class="recipe-title">{_escape_html(recipe.title)}</div>')
             
             meta_parts = []
             if recipe.categories:
@@ -627,7 +788,7 @@ class PaprikaToAppleNotesConverter:
             html_parts.append('</div>')
         
         html_parts.append('</div>')
-        html_parts.append('</body></html>')
+        html_parts.append(_HTML_TAIL)
         
         # Write table of contents
         toc_file = self.output_dir / "00_Recipe_Collection_Table_of_Contents.html"
@@ -637,9 +798,9 @@ class PaprikaToAppleNotesConverter:
     def _make_safe_filename(self, title: str) -> str:
         """Create a safe filename from recipe title."""
         # Remove or replace problematic characters
-        safe = re.sub(r'[<>:"/\\|?*]', '', title)
-        safe = re.sub(r'[&]', 'and', safe)
-        safe = re.sub(r'\s+', '_', safe.strip())
+        safe = _UNSAFE_FILENAME_RE.sub('', title)
+        safe = _AMPERSAND_RE.sub('and', safe)
+        safe = _WS_RE.sub('_', safe.strip())
         
         # Limit length
         if len(safe) > 100: